@@ -20,7 +20,7 @@ CREATE TABLE `user_optimization` (
   `database_alias` varchar(32) NOT NULL COMMENT '唯一别名',
   `is_read` int(2) NOT NULL COMMENT '是否已读',
   `sql_text_list` text NOT NULL COMMENT 'SQL文本',
-  `optimization_detail` text NOT NULL COMMENT '诊断详情',
+  `optimization_detail` longtext NOT NULL COMMENT '诊断详情',
   `gmt_create` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
   `deal_time` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '结束时间',
   PRIMARY KEY (`tag`),
@@ -171,6 +171,7 @@ CREATE TABLE `meta_table_statistics` (
   `table_rows` bigint(20) NOT NULL COMMENT '表行数',
   `min_value` varchar(128) DEFAULT NULL COMMENT '字段最小值',
   `max_value` varchar(128) DEFAULT NULL COMMENT '字段最大值',
+  `histogram` text DEFAULT NULL COMMENT '字段等高直方图',
   `gmt_create` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
   `gmt_modify` timestamp(6) NULL DEFAULT NULL COMMENT '更新时间',
   PRIMARY KEY (`db_id`, `table_name`, `column_name`),
@@ -178,4 +179,21 @@ CREATE TABLE `meta_table_statistics` (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8 COMMENT '表统计信息';
 
 
+CREATE TABLE `monitor_sql_optimization` (
+  `db_id` varchar(64) NOT NULL COMMENT '数据库唯一ID，包含用户id+唯一别名',
+  `sql_id` varchar(128) NOT NULL COMMENT 'SQL唯一ID',
+  `table_list` varchar(400) NULL DEFAULT NULL COMMENT 'SQL请求的Table列表',
+  `optimization_detail` text NOT NULL COMMENT '诊断详情',
+  `gmt_create` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  `gmt_modify` timestamp NULL DEFAULT NULL COMMENT '更新时间',
+  PRIMARY KEY (`db_id`, `sql_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8 COMMENT 'SQL优化建议，表的索引或统计信息变化时刷新';
 
+
+CREATE TABLE `optimization_result_cache` (
+  `cache_key` varchar(64) NOT NULL COMMENT '参数化SQL与相关表元数据指纹的哈希',
+  `result` mediumtext NOT NULL COMMENT '诊断结果',
+  `gmt_create` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  PRIMARY KEY (`cache_key`),
+  KEY `idx_gmt_create` (`gmt_create`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8 COMMENT 'SQL模板诊断结果缓存，过期结果由调度清理';
@@ -0,0 +1,34 @@
+-- Upgrade a meta database created by an earlier init/init.sql,
+-- run the statements of the changes the meta database does not have yet.
+
+
+-- user_optimization.optimization_detail: reports of analyzed files are larger than a text
+ALTER TABLE `user_optimization`
+  MODIFY COLUMN `optimization_detail` longtext NOT NULL COMMENT '诊断详情';
+
+
+-- meta_table_statistics.histogram: equi-depth histograms of the columns
+ALTER TABLE `meta_table_statistics`
+  ADD COLUMN `histogram` text DEFAULT NULL COMMENT '字段等高直方图' AFTER `max_value`;
+
+
+-- monitor_sql_optimization: optimize results of the collected sql, refreshed when their tables change
+CREATE TABLE IF NOT EXISTS `monitor_sql_optimization` (
+  `db_id` varchar(64) NOT NULL COMMENT '数据库唯一ID，包含用户id+唯一别名',
+  `sql_id` varchar(128) NOT NULL COMMENT 'SQL唯一ID',
+  `table_list` varchar(400) NULL DEFAULT NULL COMMENT 'SQL请求的Table列表',
+  `optimization_detail` text NOT NULL COMMENT '诊断详情',
+  `gmt_create` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  `gmt_modify` timestamp NULL DEFAULT NULL COMMENT '更新时间',
+  PRIMARY KEY (`db_id`, `sql_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8 COMMENT 'SQL优化建议，表的索引或统计信息变化时刷新';
+
+
+-- optimization_result_cache: optimize results of the statement templates, purged by gmt_create
+CREATE TABLE IF NOT EXISTS `optimization_result_cache` (
+  `cache_key` varchar(64) NOT NULL COMMENT '参数化SQL与相关表元数据指纹的哈希',
+  `result` mediumtext NOT NULL COMMENT '诊断结果',
+  `gmt_create` timestamp DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  PRIMARY KEY (`cache_key`),
+  KEY `idx_gmt_create` (`gmt_create`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8 COMMENT 'SQL模板诊断结果缓存，过期结果由调度清理';